@@ -0,0 +1,66 @@
+import argparse
+import math
+
+import numpy as np
+import yaml
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _fill_y(x0, step, n, a, b, c, out):
+        for i in range(n):
+            x = x0 + i * step
+            s = math.sin(b * x + c)
+            out[i] = 2.0 * x + a * s * s / (3.0 + x)
+
+
+def read_config(config_path):
+    """Read calculation parameters from a YAML config file."""
+    with open(config_path) as config_file:
+        return yaml.safe_load(config_file)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Calculate y = 2x + a*sin(bx + c)^2 / (3 + x) over a grid.'
+    )
+    parser.add_argument('--config', default='config.yaml', help='path to the YAML config file')
+    parser.add_argument('--n0', type=float, help='start of the grid')
+    parser.add_argument('--step', type=float, help='grid step')
+    parser.add_argument('--nk', type=float, help='end of the grid')
+    parser.add_argument('--a', type=float, help='parameter a')
+    parser.add_argument('--b', type=float, help='parameter b')
+    parser.add_argument('--c', type=float, help='parameter c')
+    args = parser.parse_args()
+
+    cli_values = (args.n0, args.step, args.nk, args.a, args.b, args.c)
+    config = read_config(args.config) if any(v is None for v in cli_values) else {}
+    n0 = args.n0 if args.n0 is not None else config['n0']
+    step = args.step if args.step is not None else config['step']
+    nk = args.nk if args.nk is not None else config['nk']
+    param_a = args.a if args.a is not None else config['a']
+    param_b = args.b if args.b is not None else config['b']
+    param_c = args.c if args.c is not None else config['c']
+
+    x = np.arange(n0, nk + step * 0.5, step, dtype=np.float64)
+    if njit is not None:
+        y = np.empty(x.size, dtype=np.float64)
+        _fill_y(n0, step, x.size, param_a, param_b, param_c, y)
+    else:
+        s = np.sin(param_b * x + param_c)
+        y = 2.0 * x + param_a * s * s / (3.0 + x)
+
+    lines = '\n'.join(
+        f'x_value = {xi:.2f}, y = {yi:.4f}' for xi, yi in zip(x.tolist(), y.tolist())
+    )
+    with open('output_results.txt', 'w') as results_file:
+        results_file.write(lines + '\n')
+
+
+if __name__ == '__main__':
+    main()
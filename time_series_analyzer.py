@@ -0,0 +1,191 @@
+from functools import wraps
+
+import numpy as np
+import pandas as pd
+from pytrends.request import TrendReq
+
+try:
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+
+if _HAS_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def _mov_mean(x, w, out):
+        s = 0.0
+        for i in range(x.size):
+            s += x[i]
+            if i >= w:
+                s -= x[i - w]
+            out[i] = s / w if i >= w - 1 else np.nan
+
+
+_TRENDREQ = None
+
+
+def _get_trendreq():
+    """Return the shared TrendReq session, creating it on first use."""
+    global _TRENDREQ
+    if _TRENDREQ is None:
+        _TRENDREQ = TrendReq()
+    return _TRENDREQ
+
+
+def _require_positive_int(arg_name, default):
+    """Build a decorator that checks one method argument is a positive int.
+
+    The validated argument must be the first parameter after self, so it
+    is caught whether it is passed positionally or by keyword.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if len(args) > 1:
+                value = args[1]
+            else:
+                value = kwargs.get(arg_name, default)
+            if type(value) is not int or value <= 0:
+                raise ValueError(f'{arg_name} must be a positive integer')
+            return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class TimeSeriesAnalyzer:
+    """Analyze Google Trends interest for a keyword over a timeframe."""
+
+    def __init__(self, keyword, timeframe, data=None):
+        self.keyword = keyword
+        self.timeframe = timeframe
+        self._pytrends = None
+        self.data = data if data is not None else self._load_data()
+        self._data_np = self.data.to_numpy(dtype=np.float64)
+        self._index = self.data.index
+        self._clean = None
+        self.moving_avg_data = self.calculate_moving_average()
+
+    @property
+    def pytrends(self):
+        """TrendReq session, shared across analyzers and created on first use."""
+        if self._pytrends is None:
+            self._pytrends = _get_trendreq()
+        return self._pytrends
+
+    def _ensure_clean(self):
+        """Fill the NaN-free moving-average cache if it is stale."""
+        if self._clean is None:
+            series = self.moving_avg_data.dropna()
+            self._clean = (series, series.to_numpy())
+        return self._clean
+
+    @property
+    def _valid(self):
+        """Moving average with NaN rows dropped, computed lazily and cached."""
+        return self._ensure_clean()[0]
+
+    @property
+    def _valid_np(self):
+        """NumPy view of the NaN-free moving average, cached alongside _valid."""
+        return self._ensure_clean()[1]
+
+    def _load_data(self):
+        """Download the interest-over-time series for the keyword."""
+        self.pytrends.build_payload([self.keyword], timeframe=self.timeframe)
+        data = self.pytrends.interest_over_time()
+        return data[self.keyword]
+
+    @_require_positive_int('window_size', 7)
+    def calculate_moving_average(self, window_size=7):
+        """Return the rolling mean of the raw series."""
+        if _HAS_NUMBA:
+            out = np.empty(self._data_np.shape[0])
+            _mov_mean(self._data_np, window_size, out)
+            self.moving_avg_data = pd.Series(out, index=self._index)
+        else:
+            self.moving_avg_data = self.data.rolling(window=window_size).mean()
+        self._ma_np = self.moving_avg_data.to_numpy()
+        self._clean = None
+        return self.moving_avg_data
+
+    def calculate_differential(self):
+        """Return the first difference of the moving average."""
+        v = self._ma_np
+        d = np.empty_like(v)
+        if d.size:
+            d[0] = np.nan
+            np.subtract(v[1:], v[:-1], out=d[1:])
+        return pd.Series(d, index=self._index)
+
+    @_require_positive_int('lags', 40)
+    def calculate_auto_correlation(self, lags=40):
+        """Return the autocorrelation of the moving average, aligned to its index."""
+        valid_data = self._valid
+        if valid_data.empty:
+            raise ValueError('moving average contains no valid data')
+        # Wiener-Khinchin: autocorrelation via a zero-padded FFT, O(N log N).
+        x = self._valid_np - self._valid_np.mean()
+        n = x.size
+        m = 1 << int(np.ceil(np.log2(2 * n)))
+        spectrum = np.fft.rfft(x, m)
+        acf_values = np.fft.irfft(spectrum * np.conj(spectrum), m)[:n]
+        acf_values /= acf_values[0]
+        total = self._ma_np.shape[0]
+        out = np.full(total, np.nan)
+        k = acf_values.shape[0] - 1
+        if k:
+            out[total - k:] = acf_values[1:]
+        return pd.Series(out, index=self._index)
+
+    def _extrema_masks(self, peak_threshold):
+        """Find local maxima and minima of the moving average in one sweep.
+
+        A point is an extremum only if it rises above (or falls below)
+        both neighbours by more than peak_threshold, which suppresses
+        low-amplitude noise peaks when a positive threshold is given.
+        """
+        v = self._valid_np
+        max_mask = np.zeros(v.shape[0], dtype=bool)
+        min_mask = np.zeros(v.shape[0], dtype=bool)
+        left = v[1:-1] - v[:-2]
+        right = v[1:-1] - v[2:]
+        max_mask[1:-1] = (left > peak_threshold) & (right > peak_threshold)
+        min_mask[1:-1] = (left < -peak_threshold) & (right < -peak_threshold)
+        return max_mask, min_mask
+
+    def find_maxima(self, peak_threshold=0.0):
+        """Return the local maxima of the moving average."""
+        max_mask, _ = self._extrema_masks(peak_threshold)
+        return self._valid[max_mask]
+
+    def find_minima(self, peak_threshold=0.0):
+        """Return the local minima of the moving average."""
+        _, min_mask = self._extrema_masks(peak_threshold)
+        return self._valid[min_mask]
+
+    def get_results(self):
+        """Run all analyses and collect them into a single DataFrame."""
+        moving_avg = self.moving_avg_data
+        differential = self.calculate_differential()
+        auto_corr = self.calculate_auto_correlation()
+        maxima = self.find_maxima()
+        minima = self.find_minima()
+        return self.save_to_dataframe(moving_avg, differential, auto_corr, maxima, minima)
+
+    def save_to_dataframe(self, moving_avg, differential, auto_corr, maxima, minima):
+        """Combine the analysis results into a single-block DataFrame."""
+        index = self._index
+        arr = np.full((len(index), 5), np.nan)
+        arr[:, 0] = moving_avg.to_numpy()
+        arr[:, 1] = differential.to_numpy()
+        arr[:, 2] = auto_corr.to_numpy()
+        arr[index.get_indexer(maxima.index), 3] = maxima.to_numpy()
+        arr[index.get_indexer(minima.index), 4] = minima.to_numpy()
+        columns = ['Moving Average', 'Differential', 'Autocorrelation', 'Maxima', 'Minima']
+        return pd.DataFrame(arr, columns=columns, index=index, copy=False)
+
+
+if __name__ == '__main__':
+    analyzer = TimeSeriesAnalyzer('python', 'today 5-y')
+    print(analyzer.get_results())